@@ -0,0 +1,89 @@
+"""
+Batch Module - Compiled Batch Arithmetic
+
+Contains Numba-compiled kernels that evaluate many calculations at once.
+Kept separate from calculator.py so that module stays plain Python
+(and compilable with mypyc); this one requires numpy and numba.
+"""
+
+import numba
+import numpy as np
+
+
+# Operation codes, in the same order as Calculator.get_supported_operations()
+OP_CODES: dict[str, int] = {
+    "add": 0,
+    "subtract": 1,
+    "multiply": 2,
+    "divide": 3
+}
+
+
+# Batches smaller than this run on the serial kernel: below it, starting the
+# parallel kernel's worker threads costs more than the arithmetic saves
+_PARALLEL_THRESHOLD = 4096
+
+# fastmath without the "nnan"/"ninf" flags: the kernels write nan for division
+# by zero, so the compiler must not assume results are finite
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@numba.njit(fastmath=_FASTMATH, cache=True)
+def _compute_one(c: int, a: float, b: float) -> float:
+    if c == 0:
+        return a + b
+    elif c == 1:
+        return a - b
+    elif c == 2:
+        return a * b
+    return a / b if b != 0 else np.nan
+
+
+@numba.njit(fastmath=_FASTMATH, cache=True)
+def _batch_compute_serial(op_codes: np.ndarray, a: np.ndarray, b: np.ndarray, out: np.ndarray) -> None:
+    for i in range(op_codes.shape[0]):
+        out[i] = _compute_one(op_codes[i], a[i], b[i])
+
+
+@numba.njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def _batch_compute_parallel(op_codes: np.ndarray, a: np.ndarray, b: np.ndarray, out: np.ndarray) -> None:
+    for i in numba.prange(op_codes.shape[0]):
+        out[i] = _compute_one(op_codes[i], a[i], b[i])
+
+
+def compute_batch(op_codes: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Evaluate a batch of calculations.
+
+    Args:
+        op_codes: int64 array of operation codes (see OP_CODES)
+        a: float64 array of first operands
+        b: float64 array of second operands
+
+    Returns:
+        float64 array of results, in input order; nan where division by zero
+        was attempted
+
+    Example:
+        >>> compute_batch(np.array([0, 3]), np.array([10.0, 1.0]), np.array([5.0, 0.0]))
+        array([15., nan])
+    """
+    n = op_codes.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    if n < _PARALLEL_THRESHOLD:
+        _batch_compute_serial(op_codes, a, b, out)
+    else:
+        _batch_compute_parallel(op_codes, a, b, out)
+    return out
+
+
+def warm_up() -> None:
+    """
+    Compile (or load from cache) both batch kernels ahead of the first request.
+    """
+    op_codes = np.zeros(1, dtype=np.int64)
+    a = np.zeros(1, dtype=np.float64)
+    b = np.ones(1, dtype=np.float64)
+    out = np.empty(1, dtype=np.float64)
+    _batch_compute_serial(op_codes, a, b, out)
+    _batch_compute_parallel(op_codes, a, b, out)
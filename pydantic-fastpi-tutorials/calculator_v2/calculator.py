@@ -3,9 +3,20 @@ Calculator Module - OOP Implementation
 
 Contains the Calculator class with all arithmetic operations.
 This module is independent of FastAPI and can be used in any Python application.
+
+The module is fully type-annotated so it can be compiled ahead of time
+with mypyc (pip install mypy), from the calculator_v2 directory:
+
+    mypyc calculator.py
+
+This builds a C extension (calculator.*.so) next to calculator.py, which
+Python imports in preference to the source file, so `from calculator import
+Calculator` picks up the compiled version without code changes. Delete the
+.so file to go back to the pure-Python module.
 """
 
-from typing import Dict, Callable
+import math
+from typing import Callable, ClassVar, Dict
 
 
 class Calculator:
@@ -31,21 +42,12 @@ class Calculator:
         28.0
     """
 
-    def __init__(self):
-        """
-        Initialize the Calculator.
+    # Operation name -> function table, shared by all instances.
+    # Assigned after the class body (below) so it can reference the staticmethods.
+    _operations: ClassVar[Dict[str, Callable[[float, float], float]]]
 
-        Sets up the operation mapping for the calculate method.
-        """
-        # Map operation names to methods
-        self._operations: Dict[str, Callable[[float, float], float]] = {
-            "add": self.add,
-            "subtract": self.subtract,
-            "multiply": self.multiply,
-            "divide": self.divide
-        }
-
-    def add(self, a: float, b: float) -> float:
+    @staticmethod
+    def add(a: float, b: float) -> float:
         """
         Add two numbers.
 
@@ -63,7 +65,8 @@ class Calculator:
         """
         return a + b
 
-    def subtract(self, a: float, b: float) -> float:
+    @staticmethod
+    def subtract(a: float, b: float) -> float:
         """
         Subtract second number from first.
 
@@ -81,7 +84,8 @@ class Calculator:
         """
         return a - b
 
-    def multiply(self, a: float, b: float) -> float:
+    @staticmethod
+    def multiply(a: float, b: float) -> float:
         """
         Multiply two numbers.
 
@@ -99,7 +103,8 @@ class Calculator:
         """
         return a * b
 
-    def divide(self, a: float, b: float) -> float:
+    @staticmethod
+    def divide(a: float, b: float) -> float:
         """
         Divide first number by second.
 
@@ -108,23 +113,24 @@ class Calculator:
             b: Denominator
 
         Returns:
-            The quotient of a and b
-
-        Raises:
-            ZeroDivisionError: If b is zero
+            The quotient of a and b. If b is zero, +/-inf (signed by the
+            signs of a and of the zero b) or nan when a is zero or nan, as
+            in IEEE-754.
 
         Example:
             >>> calc = Calculator()
             >>> calc.divide(10, 5)
             2.0
             >>> calc.divide(10, 0)
-            Traceback (most recent call last):
-                ...
-            ZeroDivisionError: Cannot divide by zero
+            inf
+            >>> calc.divide(float("nan"), 0)
+            nan
         """
-        if b == 0:
-            raise ZeroDivisionError("Cannot divide by zero")
-        return a / b
+        if b:
+            return a / b
+        if not a or math.isnan(a):
+            return math.nan
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
 
     def calculate(self, operation: str, num1: float, num2: float) -> float:
         """
@@ -142,7 +148,6 @@ class Calculator:
 
         Raises:
             ValueError: If operation is not supported
-            ZeroDivisionError: If dividing by zero
 
         Example:
             >>> calc = Calculator()
@@ -158,15 +163,13 @@ class Calculator:
         # Normalize operation name to lowercase
         operation = operation.lower()
 
-        # Check if operation is supported
-        if operation not in self._operations:
+        # Get the appropriate method with a single lookup and call it
+        operation_method = self._operations.get(operation)
+        if operation_method is None:
             raise ValueError(
                 f"Unsupported operation: {operation}. "
                 f"Supported operations: {', '.join(self._operations.keys())}"
             )
-
-        # Get the appropriate method and call it
-        operation_method = self._operations[operation]
         return operation_method(num1, num2)
 
     def get_supported_operations(self) -> list[str]:
@@ -184,6 +187,15 @@ class Calculator:
         return list(self._operations.keys())
 
 
+# Built once at import; the entries are the staticmethods' plain functions
+Calculator._operations = {
+    "add": Calculator.add,
+    "subtract": Calculator.subtract,
+    "multiply": Calculator.multiply,
+    "divide": Calculator.divide
+}
+
+
 # Example usage
 if __name__ == "__main__":
     # Create calculator instance
@@ -216,10 +228,9 @@ if __name__ == "__main__":
 
     # Test error handling
     print("\nTesting error handling:")
-    try:
-        result = calc.divide(10, 0)
-    except ZeroDivisionError as e:
-        print(f"Division by zero: {e}")
+    result = calc.divide(10, 0)
+    if not math.isfinite(result):
+        print(f"Division by zero: 10 ÷ 0 = {result}")
 
     try:
         result = calc.calculate("power", 2, 3)
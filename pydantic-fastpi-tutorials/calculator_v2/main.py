@@ -2,44 +2,49 @@
 FastAPI Calculator - Version 2 (Modular with OOP)
 
 A calculator API that separates business logic from the API layer.
-Uses the Calculator class for all arithmetic operations.
+The Calculator class provides the business logic; the /calculate endpoint
+evaluates the same primitive operations inline.
 """
 
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
-from typing import Literal
-from enum import Enum
+from pydantic_core import to_json
+from typing import Literal, Optional
+import math
+import numpy as np
 
 # Import the Calculator class from our module
 from calculator import Calculator
+from batch import OP_CODES, compute_batch, warm_up
 
 
 # Pydantic Models for Request and Response
-class OperationType(str, Enum):
-    """Enum for supported calculator operations"""
-    ADD = "add"
-    SUBTRACT = "subtract"
-    MULTIPLY = "multiply"
-    DIVIDE = "divide"
-
-
 class CalculationRequest(BaseModel):
     """
     Request model for calculation endpoint.
 
     Validates incoming calculation requests with Pydantic.
     """
-    operation: OperationType = Field(
+    # A Literal is validated as a plain string membership check in pydantic-core,
+    # so no Enum instance is created per request
+    operation: Literal["add", "subtract", "multiply", "divide"] = Field(
         ...,
         description="The mathematical operation to perform"
     )
+    # allow_inf_nan=False rejects NaN/Infinity inside pydantic-core, so the
+    # handlers never see non-finite operands
     num1: float = Field(
         ...,
-        description="First operand"
+        description="First operand",
+        allow_inf_nan=False
     )
     num2: float = Field(
         ...,
-        description="Second operand"
+        description="Second operand",
+        allow_inf_nan=False
     )
 
     model_config = {
@@ -80,70 +85,168 @@ class CalculationResponse(BaseModel):
     }
 
 
+class BatchCalculationRequest(BaseModel):
+    """
+    Request model for the batch calculation endpoint.
+
+    Bundles many calculations into one request so the per-request framework
+    overhead is paid once for the whole batch.
+    """
+    items: list[CalculationRequest] = Field(
+        ...,
+        description="The calculations to perform",
+        max_length=10_000
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "items": [
+                        {"operation": "add", "num1": 10, "num2": 5},
+                        {"operation": "divide", "num1": 10, "num2": 4}
+                    ]
+                }
+            ]
+        }
+    }
+
+
+class BatchCalculationResponse(BaseModel):
+    """
+    Response model for the batch calculation endpoint.
+
+    Results are returned in the same order as the request items.
+    """
+    results: list[Optional[float]] = Field(
+        ...,
+        description="The calculated results; null where the result is not finite (division by zero or overflow)"
+    )
+    count: int = Field(..., description="Number of calculations performed")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "results": [15, 2.5],
+                    "count": 2
+                }
+            ]
+        }
+    }
+
+
 # FastAPI Application
 app = FastAPI(
     title="Calculator API - Version 2",
-    description="A modular calculator API using OOP principles with separated business logic",
+    description="A calculator API with Pydantic validation and inline arithmetic endpoints",
     version="2.0.0",
     docs_url="/docs",
     redoc_url="/redoc"
 )
 
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    """
+    Return validation errors serialized by pydantic-core.
+
+    The default handler echoes the offending input through the stdlib json
+    encoder, which fails on a rejected NaN/Infinity literal and turns the 422
+    into a 500. pydantic-core serializes those values as null instead.
+    """
+    return Response(
+        content=to_json({"detail": jsonable_encoder(exc.errors())}, inf_nan_mode="null"),
+        status_code=422,
+        media_type="application/json"
+    )
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """
+    Turn any unexpected error into a generic 500 response.
+
+    Registered once for the whole app, so endpoints don't need their own
+    catch-all try/except.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "An unexpected error occurred"}
+    )
+
+
 # Create Calculator instance (business logic layer)
 calculator = Calculator()
 
+# Error responses with constant details are built once and re-raised.
+# with_traceback(None) drops the previous traceback so it doesn't grow per raise.
+_DIV_ZERO_EXC = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Cannot divide by zero"
+)
+_OUT_OF_RANGE_EXC = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Result is out of range"
+)
+
+# Compile the batch kernel now so the first /calculate_batch request doesn't wait for it
+warm_up()
+
+# Supported operations are fixed at startup, so build the /operations payload once
+_OPERATION_INFO = {
+    "add": {"description": "Addition (a + b)", "symbol": "+"},
+    "subtract": {"description": "Subtraction (a - b)", "symbol": "-"},
+    "multiply": {"description": "Multiplication (a × b)", "symbol": "×"},
+    "divide": {"description": "Division (a ÷ b)", "symbol": "÷"}
+}
+_operations_info = [
+    {
+        "operation": op,
+        **_OPERATION_INFO.get(op, {"description": f"Operation: {op}", "symbol": "?"})
+    }
+    for op in calculator.get_supported_operations()
+]
+_OPERATIONS_RESPONSE = {
+    "supported_operations": _operations_info,
+    "total_count": len(_operations_info)
+}
+
 
 @app.get("/", tags=["General"])
-def root():
+async def root():
     """
     Welcome endpoint with API information.
     """
     return {
         "message": "Welcome to Calculator API - Version 2",
-        "description": "A modular calculator with OOP-based business logic",
+        "description": "A calculator API with Pydantic-validated requests",
         "version": "2.0.0",
-        "architecture": "OOP with separated modules (Calculator class + FastAPI)",
+        "architecture": "FastAPI endpoints with inline arithmetic (Calculator class for library use)",
         "features": [
-            "Object-oriented design",
-            "Separated business logic",
+            "Inline arithmetic on the request path",
+            "Reusable Calculator class",
             "Testable components",
             "Pydantic validation"
         ],
         "endpoints": {
             "documentation": "/docs",
             "calculate": "POST /calculate",
+            "calculate_batch": "POST /calculate_batch",
             "operations": "GET /operations"
         }
     }
 
 
 @app.get("/operations", tags=["General"])
-def get_operations():
+async def get_operations():
     """
     Get list of all supported operations.
 
-    This endpoint dynamically fetches supported operations from the Calculator class.
+    The payload is built once at startup from the Calculator class,
+    since the supported operations cannot change while the app is running.
     """
-    supported_ops = calculator.get_supported_operations()
-
-    operations_info = []
-    for op in supported_ops:
-        if op == "add":
-            info = {"operation": op, "description": "Addition (a + b)", "symbol": "+"}
-        elif op == "subtract":
-            info = {"operation": op, "description": "Subtraction (a - b)", "symbol": "-"}
-        elif op == "multiply":
-            info = {"operation": op, "description": "Multiplication (a × b)", "symbol": "×"}
-        elif op == "divide":
-            info = {"operation": op, "description": "Division (a ÷ b)", "symbol": "÷"}
-        else:
-            info = {"operation": op, "description": f"Operation: {op}", "symbol": "?"}
-        operations_info.append(info)
-
-    return {
-        "supported_operations": operations_info,
-        "total_count": len(operations_info)
-    }
+    return _OPERATIONS_RESPONSE
 
 
 @app.post(
@@ -152,12 +255,12 @@ def get_operations():
     status_code=status.HTTP_200_OK,
     tags=["Calculator"]
 )
-def calculate(request: CalculationRequest):
+async def calculate(request: CalculationRequest):
     """
-    Perform a calculation using the Calculator class.
+    Perform a calculation.
 
-    This endpoint delegates all business logic to the Calculator class,
-    maintaining clean separation of concerns between API and business logic layers.
+    The four primitive operations are evaluated inline on the validated
+    operation name, mirroring the semantics of the Calculator class.
 
     Supports the following operations:
     - **add**: Addition (num1 + num2)
@@ -172,48 +275,80 @@ def calculate(request: CalculationRequest):
         CalculationResponse with the result
 
     Raises:
-        HTTPException 400: If division by zero is attempted or invalid operation
+        HTTPException 400: If division by zero is attempted or the result overflows
         HTTPException 422: If invalid parameters (handled by Pydantic)
     """
-    try:
-        # Use the Calculator class to perform the calculation
-        # The calculator.calculate() method handles all the business logic
-        result = calculator.calculate(
-            operation=request.operation.value,
-            num1=request.num1,
-            num2=request.num2
-        )
-
-        # Return structured response
-        return CalculationResponse(
-            operation=request.operation.value,
-            num1=request.num1,
-            num2=request.num2,
-            result=result
-        )
-
-    except ZeroDivisionError as e:
-        # Handle division by zero error from Calculator class
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except ValueError as e:
-        # Handle invalid operation error from Calculator class
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        # Handle any unexpected errors
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"An unexpected error occurred: {str(e)}"
-        )
+    # The arithmetic is inlined here: for these primitives the cost of
+    # dispatching through the Calculator class outweighs the operation itself.
+    # Calculator remains the reference implementation for library users.
+    op = request.operation
+    a, b = request.num1, request.num2
+    if op == "add":
+        result = a + b
+    elif op == "subtract":
+        result = a - b
+    elif op == "multiply":
+        result = a * b
+    else:
+        if b == 0.0:
+            raise _DIV_ZERO_EXC.with_traceback(None)
+        result = a / b
+
+    # Operands are finite, so a non-finite result means the float overflowed
+    if not math.isfinite(result):
+        raise _OUT_OF_RANGE_EXC.with_traceback(None)
+
+    # Return a plain dict: response_model validates and documents it once,
+    # instead of validating a CalculationResponse here and again on output
+    return {
+        "operation": op,
+        "num1": a,
+        "num2": b,
+        "result": result
+    }
+
+
+# Kept as a sync def so large batches run in FastAPI's threadpool
+# instead of blocking the event loop
+@app.post(
+    "/calculate_batch",
+    response_model=BatchCalculationResponse,
+    status_code=status.HTTP_200_OK,
+    tags=["Calculator"]
+)
+def calculate_batch(request: BatchCalculationRequest):
+    """
+    Perform many calculations in a single request.
+
+    Operands are gathered into NumPy arrays and evaluated by a Numba-compiled
+    kernel, so the arithmetic runs as SIMD-vectorized, multi-threaded native
+    code rather than one Python operation per item.
+
+    Division by zero or overflow does not fail the batch; that item's result
+    is returned as null.
+
+    Args:
+        request: BatchCalculationRequest with the list of calculations
+
+    Returns:
+        BatchCalculationResponse with one result per item, in request order
+
+    Raises:
+        HTTPException 422: If invalid parameters or more than 10,000 items (handled by Pydantic)
+    """
+    items = request.items
+    n = len(items)
+    op_codes = np.fromiter((OP_CODES[item.operation] for item in items), dtype=np.int64, count=n)
+    a = np.fromiter((item.num1 for item in items), dtype=np.float64, count=n)
+    b = np.fromiter((item.num2 for item in items), dtype=np.float64, count=n)
+    results = compute_batch(op_codes, a, b)
+
+    # Non-finite results (nan from division by zero, inf from overflow) are serialized as null
+    return {"results": results.tolist(), "count": n}
 
 
 @app.get("/health", tags=["General"])
-def health_check():
+async def health_check():
     """
     Health check endpoint to verify the API is running.
     """
@@ -224,7 +359,14 @@ def health_check():
     }
 
 
+# Build the OpenAPI schema now that all routes are registered; FastAPI caches it,
+# so the first /docs or /openapi.json request doesn't pay for the schema walk
+app.openapi()
+
+
 # Run with: uvicorn main:app --reload (from calculator_v2 directory)
+# For serving, skip per-request access logging: uvicorn main:app --no-access-log
+# (uvicorn[standard] already picks uvloop and httptools where they are available)
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, access_log=False)